@@ -4,7 +4,7 @@
 # See the LICENSE file in the project root for more information.
 
 import ssl
-from zabbix_utils import Sender
+from zabbix_utils import ItemValue, Sender
 
 # Try importing sslpsk3, fall back to sslpsk2 if not available
 try:
@@ -14,17 +14,21 @@ except ImportError:
     import sslpsk2 as sslpsk
 
 
-# PSK wrapper function for SSL connection
-def psk_wrapper(sock, tls):
-    # Pre-Shared Key (PSK) and PSK Identity
-    psk = b'608b0a0049d41fdb35a824ef0a227f24e5099c60aa935e803370a961c937d6f7'
-    psk_identity = b'PSKID'
+# Pre-Shared Key (PSK) and PSK Identity.
+# They are defined once and reused for every connection made by the sender.
+PSK = b'608b0a0049d41fdb35a824ef0a227f24e5099c60aa935e803370a961c937d6f7'
+PSK_IDENTITY = b'PSKID'
+
 
+# PSK wrapper function for SSL connection.
+# Zabbix server/proxy closes the connection after every response,
+# so each connection made by the sender goes through its own TLS handshake.
+def psk_wrapper(sock, tls):
     return sslpsk.wrap_socket(
         sock,
         ssl_version=ssl.PROTOCOL_TLSv1_2,
         ciphers='ECDHE-PSK-AES128-CBC-SHA256',
-        psk=(psk, psk_identity)
+        psk=(PSK, PSK_IDENTITY)
     )
 
 
@@ -39,14 +43,23 @@ sender = Sender(
     socket_wrapper=psk_wrapper
 )
 
-# Send a value to a Zabbix server/proxy with specified parameters
+# Values to be sent to a Zabbix server/proxy
+values = ['value1', 'value2', 'value3']
+
+# List of ItemValue instances representing items to be sent
 # Parameters: (host, key, value, clock, ns)
-response = sender.send_value('host', 'item.key', 'value', 1695713666, 30)
+items = [ItemValue('host', 'item.key', value, 1695713666, 30 + i)
+         for i, value in enumerate(values)]
+
+# Send all items at once. Items are sent in chunks (250 items by default)
+# and every chunk uses a single PSK-wrapped TCP connection, so only one TLS
+# handshake is performed per chunk instead of one per value with send_value().
+response = sender.send(items)
 
 # Check if the value sending was successful
 if response.failed == 0:
     # Print a success message along with the response time
-    print(f"Value sent successfully in {response.time}")
+    print(f"Values sent successfully in {response.time}")
 else:
     # Print a failure message
-    print("Failed to send value")
+    print("Failed to send values")
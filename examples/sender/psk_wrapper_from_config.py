@@ -4,6 +4,7 @@
 # See the LICENSE file in the project root for more information.
 
 import ssl
+from functools import lru_cache
 from zabbix_utils import Sender
 
 # Try importing sslpsk3, fall back to sslpsk2 if not available
@@ -14,6 +15,13 @@ except ImportError:
     import sslpsk2 as sslpsk
 
 
+# Read PSK from file only once instead of doing it for every connection
+@lru_cache(maxsize=None)
+def read_psk(psk_file):
+    with open(psk_file, encoding='utf-8') as f:
+        return f.read()
+
+
 # PSK wrapper function for SSL connection
 def psk_wrapper(sock, tls):
     psk = None
@@ -22,8 +30,7 @@ def psk_wrapper(sock, tls):
 
     # Read PSK from file if specified
     if psk_file:
-        with open(psk_file, encoding='utf-8') as f:
-            psk = f.read()
+        psk = read_psk(psk_file)
 
     # Check if both PSK and PSK identity are available
     if psk and psk_identity:
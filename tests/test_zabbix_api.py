@@ -22,12 +22,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 
+import io
 import json
 import unittest
-from unittest.mock import patch
 
+from zabbix_utils import api
 from zabbix_utils.api import ZabbixAPI, APIVersion
-from zabbix_utils.common import ModuleUtils
+from zabbix_utils.common import ModuleUtils, HIDING_MASK, JSONRPC_FILE
 from zabbix_utils.version import __min_supported__, __max_supported__
 from zabbix_utils.exceptions import APINotSupported, ProcessingError
 
@@ -42,90 +43,181 @@ DEFAULT_VALUES = {
 }
 
 
-def mock_send_api_request(self, method, *args, **kwargs):
-    """Mock for send_api_request method
+MOCK_RESULTS = {
+    'apiinfo.version': f"{__max_supported__}.0",
+    'user.login': DEFAULT_VALUES['session'],
+    'user.logout': True,
+    'user.checkAuthentication': {'userid': 42}
+}
 
-    Args:
-        method (str): Zabbix API method name.
 
-        params (dict, optional): Params for request body. Defaults to {}.
+def mock_urlopen(request, *args, **kwargs):
+    """Mock for urlopen function used by ZabbixAPI.send_api_request
+
+    Args:
+        request (Request): Prepared HTTP request to Zabbix API.
 
-        need_auth (bool, optional): Authorization using flag. Defaults to False.
+    Returns:
+        BytesIO: File-like object with JSON-RPC response body.
     """
-    result = {}
-    if method == 'apiinfo.version':
-        result = f"{__max_supported__}.0"
-    elif method == 'user.login':
-        result = DEFAULT_VALUES['session']
-    elif method == 'user.logout':
-        result = True
-    elif method == 'user.checkAuthentication':
-        result = {'userid': 42}
-    return {'jsonrpc': '2.0', 'result': result, 'id': 1}
+    request_json = json.loads(request.data.decode('utf-8'))
+    return io.BytesIO(json.dumps({
+        'jsonrpc': '2.0',
+        'result': MOCK_RESULTS.get(request_json['method'], {}),
+        'id': request_json['id']
+    }).encode('utf-8'))
+
+
+LOGIN_CASES = (
+    {
+        'input': {'token': DEFAULT_VALUES['token']},
+        'output': DEFAULT_VALUES['token'],
+        'exception': ProcessingError,
+        'raised': False
+    },
+    {
+        'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': True
+    },
+    {
+        'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user']},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': True
+    },
+    {
+        'input': {'token': DEFAULT_VALUES['token'], 'password': DEFAULT_VALUES['password']},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': True
+    },
+    {
+        'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'output': 'cc364fb50199c5e305aa91785b7e49a0',
+        'exception': ProcessingError,
+        'raised': False
+    },
+    {
+        'input': {'user': DEFAULT_VALUES['user']},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': True
+    },
+    {
+        'input': {'password': DEFAULT_VALUES['password']},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': True
+    },
+    {
+        'input': {},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': True
+    }
+)
+
+LOGOUT_CASES = (
+    {
+        'input': {'token': DEFAULT_VALUES['token']},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': False
+    },
+    {
+        'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': True
+    },
+    {
+        'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'output': None,
+        'exception': ProcessingError,
+        'raised': False
+    }
+)
+
+CHECK_AUTH_CASES = (
+    {
+        'input': {'token': DEFAULT_VALUES['token']},
+        'output': {'login': True, 'logout': False},
+        'exception': ProcessingError,
+        'raised': False
+    },
+    {
+        'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'output': {'login': False, 'logout': False},
+        'exception': ProcessingError,
+        'raised': True
+    },
+    {
+        'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'output': {'login': True, 'logout': False},
+        'exception': ProcessingError,
+        'raised': False
+    }
+)
+
+VERSION_CONDITIONS_CASES = (
+    {
+        'input': {'token': DEFAULT_VALUES['token']},
+        'version': '5.2.0',
+        'raised': {'APINotSupported': True, 'ProcessingError': True},
+        'output': DEFAULT_VALUES['session']
+    },
+    {
+        'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'version': '5.2.0',
+        'raised': {'APINotSupported': True, 'ProcessingError': True},
+        'output': DEFAULT_VALUES['session']
+    },
+    {
+        'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'version': '5.2.0',
+        'raised': {'APINotSupported': False, 'ProcessingError': False},
+        'output': DEFAULT_VALUES['session']
+    },
+    {
+        'input': {'token': DEFAULT_VALUES['token']},
+        'version': '5.4.0',
+        'raised': {'APINotSupported': False, 'ProcessingError': False},
+        'output': DEFAULT_VALUES['token']
+    },
+    {
+        'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'version': '5.4.0',
+        'raised': {'APINotSupported': False, 'ProcessingError': True},
+        'output': DEFAULT_VALUES['token']
+    },
+    {
+        'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
+        'version': '5.4.0',
+        'raised': {'APINotSupported': False, 'ProcessingError': False},
+        'output': DEFAULT_VALUES['session']
+    }
+)
 
 
 class TestZabbixAPI(unittest.TestCase):
     """Test cases for ZabbixAPI object"""
 
+    def setUp(self):
+        self.urlopen = api.ul.urlopen
+        self.api_version = ZabbixAPI.api_version
+        api.ul.urlopen = mock_urlopen
+
+    def tearDown(self):
+        api.ul.urlopen = self.urlopen
+        ZabbixAPI.api_version = self.api_version
+
     def test_login(self):
         """Tests login in different auth cases"""
 
-        test_cases = [
-            {
-                'input': {'token': DEFAULT_VALUES['token']},
-                'output': DEFAULT_VALUES['token'],
-                'exception': ProcessingError,
-                'raised': False
-            },
-            {
-                'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': True
-            },
-            {
-                'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user']},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': True
-            },
-            {
-                'input': {'token': DEFAULT_VALUES['token'], 'password': DEFAULT_VALUES['password']},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': True
-            },
-            {
-                'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'output': 'cc364fb50199c5e305aa91785b7e49a0',
-                'exception': ProcessingError,
-                'raised': False
-            },
-            {
-                'input': {'user': DEFAULT_VALUES['user']},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': True
-            },
-            {
-                'input': {'password': DEFAULT_VALUES['password']},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': True
-            },
-            {
-                'input': {},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': True
-            }
-        ]
-
-        for case in test_cases:
-            with patch.multiple(
-                    ZabbixAPI,
-                    send_api_request=mock_send_api_request):
-
+        for case in LOGIN_CASES:
+            with self.subTest(input=case['input']):
                 try:
                     zapi = ZabbixAPI(**case['input'])
                 except case['exception']:
@@ -155,32 +247,8 @@ class TestZabbixAPI(unittest.TestCase):
     def test_logout(self):
         """Tests logout in different auth cases"""
 
-        test_cases = [
-            {
-                'input': {'token': DEFAULT_VALUES['token']},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': False
-            },
-            {
-                'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': True
-            },
-            {
-                'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'output': None,
-                'exception': ProcessingError,
-                'raised': False
-            }
-        ]
-
-        for case in test_cases:
-            with patch.multiple(
-                ZabbixAPI,
-                send_api_request=mock_send_api_request):
-
+        for case in LOGOUT_CASES:
+            with self.subTest(input=case['input']):
                 try:
                     zapi = ZabbixAPI(**case['input'])
                 except case['exception']:
@@ -193,32 +261,8 @@ class TestZabbixAPI(unittest.TestCase):
     def test_check_auth(self):
         """Tests check_auth method in different auth cases"""
 
-        test_cases = [
-            {
-                'input': {'token': DEFAULT_VALUES['token']},
-                'output': {'login': True, 'logout': False},
-                'exception': ProcessingError,
-                'raised': False
-            },
-            {
-                'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'output': {'login': False, 'logout': False},
-                'exception': ProcessingError,
-                'raised': True
-            },
-            {
-                'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'output': {'login': True, 'logout': False},
-                'exception': ProcessingError,
-                'raised': False
-            }
-        ]
-
-        for case in test_cases:
-            with patch.multiple(
-                ZabbixAPI,
-                send_api_request=mock_send_api_request):
-
+        for case in CHECK_AUTH_CASES:
+            with self.subTest(input=case['input']):
                 try:
                     zapi = ZabbixAPI(**case['input'])
                 except case['exception']:
@@ -235,79 +279,34 @@ class TestZabbixAPI(unittest.TestCase):
     def test_check_version(self):
         """Tests __check_version method with different versions"""
 
-        with patch.multiple(
-                ZabbixAPI,
-                api_version=lambda s: APIVersion(DEFAULT_VALUES['max_version'])):
+        ZabbixAPI.api_version = lambda s: VERSIONS[DEFAULT_VALUES['max_version']]
 
-            with self.assertRaises(APINotSupported,
-                                   msg=f"version={DEFAULT_VALUES['max_version']}"):
-                ZabbixAPI()
+        with self.assertRaises(APINotSupported,
+                               msg=f"version={DEFAULT_VALUES['max_version']}"):
+            ZabbixAPI()
 
-            try: 
-                ZabbixAPI(skip_version_check=True)
-            except Exception:
-                self.fail(f"raised unexpected Exception for version: {DEFAULT_VALUES['max_version']}")
+        try: 
+            ZabbixAPI(skip_version_check=True)
+        except Exception:
+            self.fail(f"raised unexpected Exception for version: {DEFAULT_VALUES['max_version']}")
 
-        with patch.multiple(
-                ZabbixAPI,
-                api_version=lambda s: APIVersion(DEFAULT_VALUES['min_version'])):
+        ZabbixAPI.api_version = lambda s: VERSIONS[DEFAULT_VALUES['min_version']]
 
-            with self.assertRaises(APINotSupported,
-                                   msg=f"version={DEFAULT_VALUES['min_version']}"):
-                ZabbixAPI()
+        with self.assertRaises(APINotSupported,
+                               msg=f"version={DEFAULT_VALUES['min_version']}"):
+            ZabbixAPI()
 
-            try: 
-                ZabbixAPI(skip_version_check=True)
-            except Exception:
-                self.fail(f"raised unexpected Exception for version: {DEFAULT_VALUES['min_version']}")
+        try: 
+            ZabbixAPI(skip_version_check=True)
+        except Exception:
+            self.fail(f"raised unexpected Exception for version: {DEFAULT_VALUES['min_version']}")
 
     def test_version_conditions(self):
         """Tests behavior of ZabbixAPI object depending on different versions"""
 
-        test_cases = [
-            {
-                'input': {'token': DEFAULT_VALUES['token']},
-                'version': '5.2.0',
-                'raised': {'APINotSupported': True, 'ProcessingError': True},
-                'output': DEFAULT_VALUES['session']
-            },
-            {
-                'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'version': '5.2.0',
-                'raised': {'APINotSupported': True, 'ProcessingError': True},
-                'output': DEFAULT_VALUES['session']
-            },
-            {
-                'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'version': '5.2.0',
-                'raised': {'APINotSupported': False, 'ProcessingError': False},
-                'output': DEFAULT_VALUES['session']
-            },
-            {
-                'input': {'token': DEFAULT_VALUES['token']},
-                'version': '5.4.0',
-                'raised': {'APINotSupported': False, 'ProcessingError': False},
-                'output': DEFAULT_VALUES['token']
-            },
-            {
-                'input': {'token': DEFAULT_VALUES['token'], 'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'version': '5.4.0',
-                'raised': {'APINotSupported': False, 'ProcessingError': True},
-                'output': DEFAULT_VALUES['token']
-            },
-            {
-                'input': {'user': DEFAULT_VALUES['user'], 'password': DEFAULT_VALUES['password']},
-                'version': '5.4.0',
-                'raised': {'APINotSupported': False, 'ProcessingError': False},
-                'output': DEFAULT_VALUES['session']
-            }
-        ]
-
-        for case in test_cases:
-            with patch.multiple(
-                    ZabbixAPI,
-                    send_api_request=mock_send_api_request,
-                    api_version=lambda s: APIVersion(case['version'])):
+        for case in VERSION_CONDITIONS_CASES:
+            with self.subTest(input=case['input']):
+                ZabbixAPI.api_version = lambda s, v=VERSIONS[case['version']]: v
 
                 try:
                     zapi = ZabbixAPI(**case['input'])
@@ -322,7 +321,55 @@ class TestZabbixAPI(unittest.TestCase):
                         self.fail(f"not raised expected Exception for version: {case['version']}")
 
                     self.assertEqual(zapi._ZabbixAPI__session_id, case['output'],
-                                         f"unexpected output with input data: {case['input']}")
+                                     f"unexpected output with input data: {case['input']}")
+
+
+VERSION_INIT_CASES = (
+    {'input': '7.0.0alpha', 'output': '7.0.0alpha', 'exception': TypeError, 'raised': True},
+    {'input': '6.0.0', 'output': '6.0.0', 'exception': TypeError, 'raised': False},
+    {'input': '6.0', 'output': None, 'exception': TypeError, 'raised': True},
+    {'input': '7', 'output': None, 'exception': TypeError, 'raised': True}
+)
+
+VERSION_MAJOR_CASES = (
+    {'input': '6.0.10', 'output': 6.0},
+    {'input': '6.2.0', 'output': 6.2}
+)
+
+VERSION_MINOR_CASES = (
+    {'input': '6.0.10', 'output': 10},
+    {'input': '6.2.0', 'output': 0}
+)
+
+VERSION_IS_LTS_CASES = (
+    {'input': '6.0.10', 'output': True},
+    {'input': '6.2.0', 'output': False},
+    {'input': '6.4.5', 'output': False},
+    {'input': '7.0.0', 'output': True},
+    {'input': '7.0.30', 'output': True}
+)
+
+VERSION_COMPARE_CASES = (
+    {'input': ['6.0.0','6.0.0'], 'operation': 'eq', 'output': True},
+    {'input': ['6.0.0',6.0], 'operation': 'ne', 'output': False},
+    {'input': ['6.0.0',6.0], 'operation': 'ge', 'output': True},
+    {'input': ['6.0.0',7.0], 'operation': 'lt', 'output': True},
+    {'input': ['6.4.1',6.4], 'operation': 'gt', 'output': False}
+)
+
+# APIVersion objects don't change after creation,
+# so they are created once and shared between test cases
+VERSIONS = {
+    ver: APIVersion(ver) for ver in {
+        DEFAULT_VALUES['max_version'],
+        DEFAULT_VALUES['min_version'],
+        *(case['version'] for case in VERSION_CONDITIONS_CASES),
+        *(case['input'] for case in VERSION_MAJOR_CASES),
+        *(case['input'] for case in VERSION_MINOR_CASES),
+        *(case['input'] for case in VERSION_IS_LTS_CASES),
+        *(case['input'][0] for case in VERSION_COMPARE_CASES)
+    }
+}
 
 
 class TestAPIVersion(unittest.TestCase):
@@ -331,85 +378,57 @@ class TestAPIVersion(unittest.TestCase):
     def test_init(self):
         """Tests creating of APIVersion object"""
 
-        test_cases = [
-            {'input': '7.0.0alpha', 'output': '7.0.0alpha', 'exception': TypeError, 'raised': True},
-            {'input': '6.0.0', 'output': '6.0.0', 'exception': TypeError, 'raised': False},
-            {'input': '6.0', 'output': None, 'exception': TypeError, 'raised': True},
-            {'input': '7', 'output': None, 'exception': TypeError, 'raised': True}
-        ]
-
-        for case in test_cases:
-            try:
-                ver = APIVersion(case['input'])
-            except ValueError:
-                if not case['raised']:
-                    self.fail(f"raised unexpected Exception with input data: {case['input']}")
-            else:
-                if case['raised']:
-                    self.fail(f"not raised expected Exception with input data: {case['input']}")
-                self.assertEqual(str(ver), case['output'],
-                                 f"unexpected output with input data: {case['input']}")
+        for case in VERSION_INIT_CASES:
+            with self.subTest(input=case['input']):
+                try:
+                    ver = APIVersion(case['input'])
+                except ValueError:
+                    if not case['raised']:
+                        self.fail(f"raised unexpected Exception with input data: {case['input']}")
+                else:
+                    if case['raised']:
+                        self.fail(f"not raised expected Exception with input data: {case['input']}")
+                    self.assertEqual(str(ver), case['output'],
+                                     f"unexpected output with input data: {case['input']}")
 
     def test_major(self):
         """Tests getting the major version part of APIVersion"""
 
-        test_cases = [
-            {'input': '6.0.10', 'output': 6.0},
-            {'input': '6.2.0', 'output': 6.2}
-        ]
-
-        for case in test_cases:
-            ver = APIVersion(case['input'])
-            self.assertEqual(ver.major, case['output'],
-                             f"unexpected output with input data: {case['input']}")
+        for case in VERSION_MAJOR_CASES:
+            with self.subTest(input=case['input']):
+                ver = VERSIONS[case['input']]
+                self.assertEqual(ver.major, case['output'],
+                                 f"unexpected output with input data: {case['input']}")
 
     def test_minor(self):
         """Tests getting the minor version part of APIVersion"""
 
-        test_cases = [
-            {'input': '6.0.10', 'output': 10},
-            {'input': '6.2.0', 'output': 0}
-        ]
-
-        for case in test_cases:
-            ver = APIVersion(case['input'])
-            self.assertEqual(ver.minor, case['output'],
-                             f"unexpected output with input data: {case['input']}")
+        for case in VERSION_MINOR_CASES:
+            with self.subTest(input=case['input']):
+                ver = VERSIONS[case['input']]
+                self.assertEqual(ver.minor, case['output'],
+                                 f"unexpected output with input data: {case['input']}")
 
     def test_is_lts(self):
         """Tests is_lts method for different versions"""
 
-        test_cases = [
-            {'input': '6.0.10', 'output': True},
-            {'input': '6.2.0', 'output': False},
-            {'input': '6.4.5', 'output': False},
-            {'input': '7.0.0', 'output': True},
-            {'input': '7.0.30', 'output': True}
-        ]
-
-        for case in test_cases:
-            ver = APIVersion(case['input'])
-            self.assertEqual(ver.is_lts(), case['output'],
-                             f"unexpected output with input data: {case['input']}")
+        for case in VERSION_IS_LTS_CASES:
+            with self.subTest(input=case['input']):
+                ver = VERSIONS[case['input']]
+                self.assertEqual(ver.is_lts(), case['output'],
+                                 f"unexpected output with input data: {case['input']}")
 
     def test_compare(self):
         """Tests version comparison for different version formats"""
 
-        test_cases = [
-            {'input': ['6.0.0','6.0.0'], 'operation': 'eq', 'output': True},
-            {'input': ['6.0.0',6.0], 'operation': 'ne', 'output': False},
-            {'input': ['6.0.0',6.0], 'operation': 'ge', 'output': True},
-            {'input': ['6.0.0',7.0], 'operation': 'lt', 'output': True},
-            {'input': ['6.4.1',6.4], 'operation': 'gt', 'output': False}
-        ]
-
-        for case in test_cases:
-            ver = APIVersion(case['input'][0])
-            result = (getattr(ver, f"__{case['operation']}__")(case['input'][1]))
-            self.assertEqual(result, case['output'],
-                             f"unexpected output with input data: {case['input']}")
-
-        ver = APIVersion('6.0.0')
+        for case in VERSION_COMPARE_CASES:
+            with self.subTest(input=case['input']):
+                ver = VERSIONS[case['input'][0]]
+                result = (getattr(ver, f"__{case['operation']}__")(case['input'][1]))
+                self.assertEqual(result, case['output'],
+                                 f"unexpected output with input data: {case['input']}")
+
+        ver = VERSIONS['6.0.0']
         with self.assertRaises(TypeError,
                                msg=f"input data={case['input']}"):
             ver > {}
@@ -431,122 +450,120 @@ class TestAPIVersion(unittest.TestCase):
             ver <= '7.0'
 
 
+CHECK_URL_CASES = (
+    {'input': '127.0.0.1', 'output': f"http://127.0.0.1/{JSONRPC_FILE}"},
+    {'input': 'https://localhost', 'output': f"https://localhost/{JSONRPC_FILE}"},
+    {'input': 'localhost/zabbix', 'output': f"http://localhost/zabbix/{JSONRPC_FILE}"},
+    {'input': 'localhost/', 'output': f"http://localhost/{JSONRPC_FILE}"},
+    {'input': f"127.0.0.1/{JSONRPC_FILE}", 'output': f"http://127.0.0.1/{JSONRPC_FILE}"}
+)
+
+MASK_SECRET_CASES = (
+    {'input': {'string': 'lZSwaQ', 'show_len': 5}, 'output': HIDING_MASK},
+    {'input': {'string': 'ZWvaGS5SzNGaR990f', 'show_len': 4}, 'output': f"ZWva{HIDING_MASK}990f"},
+    {'input': {'string': 'KZneJzgRzdlWcUjJj', 'show_len': 10}, 'output': HIDING_MASK},
+    {'input': {'string': 'g5imzEr7TPcBG47fa', 'show_len': 20}, 'output': HIDING_MASK},
+    {'input': {'string': 'In8y4eGughjBNSqEGPcqzejToVUT3OA4q5', 'show_len':2}, 'output': f"In{HIDING_MASK}q5"},
+    {'input': {'string': 'Z8pZom5EVbRZ0W5wz', 'show_len':0}, 'output': HIDING_MASK}
+)
+
+HIDE_PRIVATE_CASES = (
+    {
+        'input': [{"auth": "q2BTIw85kqmjtXl3","token": "jZAC51wHuWdwvQnx"}],
+        'output': {"auth": HIDING_MASK, "token": HIDING_MASK}
+    },
+    {
+        'input': [{"token": "jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"}],
+        'output': {"token": f"jZAC{HIDING_MASK}R2uW"}
+    },
+    {
+        'input': [{"auth": "q2BTIw85kqmjtXl3zCgSSR26gwCGVFMK"}],
+        'output': {"auth": f"q2BT{HIDING_MASK}VFMK"}
+    },
+    {
+        'input': [{"sessionid": "p1xqXSf2HhYWa2ml6R5R2uWwbP2T55vh"}],
+        'output': {"sessionid": f"p1xq{HIDING_MASK}55vh"}
+    },
+    {
+        'input': [{"password": "HlphkcKgQKvofQHP"}],
+        'output': {"password": HIDING_MASK}
+    },
+    {
+        'input': [{"result": "p1xqXSf2HhYWa2ml6R5R2uWwbP2T55vh"}],
+        'output': {"result": f"p1xq{HIDING_MASK}55vh"}
+    },
+    {
+        'input': [{"result": "6.0.0"}],
+        'output': {"result": "6.0.0"}
+    },
+    {
+        'input': [{"result": ["10"]}],
+        'output': {"result": ["10"]}
+    },
+    {
+        'input': [{"result": [{"token": "jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"}]}],
+        'output': {"result": [{"token": f"jZAC{HIDING_MASK}R2uW"}]}
+    },
+    {
+        'input': [{"result": [["10"],["15"]]}],
+        'output': {"result": [["10"],["15"]]}
+    },
+    {
+        'input': [{"result": [[{"token": "jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"}]]}],
+        'output': {"result": [[{"token": f"jZAC{HIDING_MASK}R2uW"}]]}
+    },
+    {
+        'input': [{"result": ["jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"]}],
+        'output': {"result": [f"jZAC{HIDING_MASK}R2uW"]}
+    },
+    {
+        'input': [{"result": {"passwords": ["HlphkcKgQKvofQHP"]}}],
+        'output': {"result": {"passwords": [HIDING_MASK]}}
+    },
+    {
+        'input': [{"result": {"passwords": ["HlphkcKgQKvofQHP"]}}, {}],
+        'output': {"result": {"passwords": ["HlphkcKgQKvofQHP"]}}
+    },
+    {
+        'input': [{"result": {"tokens": ["jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"]}}],
+        'output': {"result": {"tokens": [f"jZAC{HIDING_MASK}R2uW"]}}
+    },
+    {
+        'input': [{"result": ["jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"]}, {}],
+        'output': {"result": [f"jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"]}
+    }
+)
+
+
 class TestModuleUtils(unittest.TestCase):
     """Test cases for ModuleUtils class"""
 
     def test_check_url(self):
         """Tests check_url method in different cases"""
 
-        filename = ModuleUtils.JSONRPC_FILE
-
-        test_cases = [
-            {'input': '127.0.0.1', 'output': f"http://127.0.0.1/{filename}"},
-            {'input': 'https://localhost', 'output': f"https://localhost/{filename}"},
-            {'input': 'localhost/zabbix', 'output': f"http://localhost/zabbix/{filename}"},
-            {'input': 'localhost/', 'output': f"http://localhost/{filename}"},
-            {'input': f"127.0.0.1/{filename}", 'output': f"http://127.0.0.1/{filename}"}
-        ]
-
-        for case in test_cases:
-            result = ModuleUtils.check_url(case['input'])
-            self.assertEqual(result, case['output'],
-                             f"unexpected output with input data: {case['input']}")
+        for case in CHECK_URL_CASES:
+            with self.subTest(input=case['input']):
+                result = ModuleUtils.check_url(case['input'])
+                self.assertEqual(result, case['output'],
+                                 f"unexpected output with input data: {case['input']}")
 
     def test_mask_secret(self):
         """Tests mask_secret method in different cases"""
 
-        mask = ModuleUtils.HIDING_MASK
-
-        test_cases = [
-            {'input': {'string': 'lZSwaQ', 'show_len': 5}, 'output': mask},
-            {'input': {'string': 'ZWvaGS5SzNGaR990f', 'show_len': 4}, 'output': f"ZWva{mask}990f"},
-            {'input': {'string': 'KZneJzgRzdlWcUjJj', 'show_len': 10}, 'output': mask},
-            {'input': {'string': 'g5imzEr7TPcBG47fa', 'show_len': 20}, 'output': mask},
-            {'input': {'string': 'In8y4eGughjBNSqEGPcqzejToVUT3OA4q5', 'show_len':2}, 'output': f"In{mask}q5"},
-            {'input': {'string': 'Z8pZom5EVbRZ0W5wz', 'show_len':0}, 'output': mask}
-        ]
-
-        for case in test_cases:
-            result = ModuleUtils.mask_secret(**case['input'])
-            self.assertEqual(result, case['output'],
-                             f"unexpected output with input data: {case['input']}")
+        for case in MASK_SECRET_CASES:
+            with self.subTest(input=case['input']):
+                result = ModuleUtils.mask_secret(**case['input'])
+                self.assertEqual(result, case['output'],
+                                 f"unexpected output with input data: {case['input']}")
 
     def test_hide_private(self):
         """Tests hide_private method in different cases"""
 
-        mask = ModuleUtils.HIDING_MASK
-
-        test_cases = [
-            {
-                'input': [{"auth": "q2BTIw85kqmjtXl3","token": "jZAC51wHuWdwvQnx"}],
-                'output': {"auth": mask, "token": mask}
-            },
-            {
-                'input': [{"token": "jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"}],
-                'output': {"token": f"jZAC{mask}R2uW"}
-            },
-            {
-                'input': [{"auth": "q2BTIw85kqmjtXl3zCgSSR26gwCGVFMK"}],
-                'output': {"auth": f"q2BT{mask}VFMK"}
-            },
-            {
-                'input': [{"sessionid": "p1xqXSf2HhYWa2ml6R5R2uWwbP2T55vh"}],
-                'output': {"sessionid": f"p1xq{mask}55vh"}
-            },
-            {
-                'input': [{"password": "HlphkcKgQKvofQHP"}],
-                'output': {"password": mask}
-            },
-            {
-                'input': [{"result": "p1xqXSf2HhYWa2ml6R5R2uWwbP2T55vh"}],
-                'output': {"result": f"p1xq{mask}55vh"}
-            },
-            {
-                'input': [{"result": "6.0.0"}],
-                'output': {"result": "6.0.0"}
-            },
-            {
-                'input': [{"result": ["10"]}],
-                'output': {"result": ["10"]}
-            },
-            {
-                'input': [{"result": [{"token": "jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"}]}],
-                'output': {"result": [{"token": f"jZAC{mask}R2uW"}]}
-            },
-            {
-                'input': [{"result": [["10"],["15"]]}],
-                'output': {"result": [["10"],["15"]]}
-            },
-            {
-                'input': [{"result": [[{"token": "jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"}]]}],
-                'output': {"result": [[{"token": f"jZAC{mask}R2uW"}]]}
-            },
-            {
-                'input': [{"result": ["jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"]}],
-                'output': {"result": [f"jZAC{mask}R2uW"]}
-            },
-            {
-                'input': [{"result": {"passwords": ["HlphkcKgQKvofQHP"]}}],
-                'output': {"result": {"passwords": [mask]}}
-            },
-            {
-                'input': [{"result": {"passwords": ["HlphkcKgQKvofQHP"]}}, {}],
-                'output': {"result": {"passwords": ["HlphkcKgQKvofQHP"]}}
-            },
-            {
-                'input': [{"result": {"tokens": ["jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"]}}],
-                'output': {"result": {"tokens": [f"jZAC{mask}R2uW"]}}
-            },
-            {
-                'input': [{"result": ["jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"]}, {}],
-                'output': {"result": [f"jZAC51wHuWdwvQnxwbP2T55vh6R5R2uW"]}
-            }
-        ]
-
-        for case in test_cases:
-            result = ModuleUtils.hide_private(*case['input'])
-            self.assertEqual(result, case['output'],
-                             f"unexpected output with input data: {case['input']}")
+        for case in HIDE_PRIVATE_CASES:
+            with self.subTest(input=case['input']):
+                result = ModuleUtils.hide_private(*case['input'])
+                self.assertEqual(result, case['output'],
+                                 f"unexpected output with input data: {case['input']}")
 
 
 if __name__ == '__main__':
@@ -41,7 +41,7 @@ try:
 except ImportError:
     from typing_extensions import Self
 
-from .common import ModuleUtils
+from .common import ModuleUtils, HIDING_MASK
 from .logger import EmptyHandler, SensitiveFilter
 from .exceptions import APIRequestError, APINotSupported, ProcessingError
 from .version import __version__, __min_supported__, __max_supported__
@@ -273,7 +273,7 @@ class ZabbixAPI():
         log.debug(
             "Enable Basic Authentication with username:%s password:%s",
             user,
-            ModuleUtils.HIDING_MASK
+            HIDING_MASK
         )
 
         self.__basic_cred = base64.b64encode(
@@ -341,7 +341,7 @@ class ZabbixAPI():
             }
 
         log.debug(
-            "Login to Zabbix API using username:%s password:%s", user, ModuleUtils.HIDING_MASK
+            "Login to Zabbix API using username:%s password:%s", user, HIDING_MASK
         )
         self.__use_token = False
         self.__session_id = self.user.login(**user_cred)
@@ -31,14 +31,18 @@ from textwrap import shorten
 from logging import Logger
 from socket import socket
 
+# Hidding mask for sensitive data
+HIDING_MASK = "*" * 8
+
+# The main php-file of Zabbix API
+JSONRPC_FILE = 'api_jsonrpc.php'
 
-class ModuleUtils():
 
-    # Hidding mask for sensitive data
-    HIDING_MASK = "*" * 8
+class ModuleUtils():
 
-    # The main php-file of Zabbix API
-    JSONRPC_FILE = 'api_jsonrpc.php'
+    # Module-level constants, also available as class attributes
+    HIDING_MASK = HIDING_MASK
+    JSONRPC_FILE = JSONRPC_FILE
 
     # Methods working without auth token
     UNAUTH_METHODS = ('apiinfo.version', 'user.login', 'user.checkAuthentication')
@@ -46,15 +50,16 @@ class ModuleUtils():
     # Methods returning files contents
     FILES_METHODS = ('configuration.export',)
 
-    # List of private fields and regular expressions to hide them
+    # List of private fields and regular expressions to hide them.
+    # Regexps are compiled once here to avoid re-parsing them for every log record.
     PRIVATE_FIELDS = {
-        "token": r"^.+$",
-        "auth": r"^.+$",
-        "passwd": r"^.+$",
-        "sessionid": r"^.+$",
-        "password": r"^.+$",
-        "current_passwd": r"^.+$",
-        "result": r"^[A-Za-z0-9]{32}$",  # To hide only token or sessionid in result
+        "token": re.compile(r"^.+$"),
+        "auth": re.compile(r"^.+$"),
+        "passwd": re.compile(r"^.+$"),
+        "sessionid": re.compile(r"^.+$"),
+        "password": re.compile(r"^.+$"),
+        "current_passwd": re.compile(r"^.+$"),
+        "result": re.compile(r"^[A-Za-z0-9]{32}$"),  # To hide only token or sessionid in result
     }
 
     @classmethod
@@ -68,8 +73,10 @@ class ModuleUtils():
             str: Checked URL of Zabbix API
         """
 
-        if not url.endswith(cls.JSONRPC_FILE):
-            url += cls.JSONRPC_FILE if url[-1] == '/' else '/' + cls.JSONRPC_FILE
+        filename = cls.JSONRPC_FILE
+
+        if not url.endswith(filename):
+            url += filename if url.endswith('/') else f"/{filename}"
         if not url.startswith('http'):
             url = 'http://' + url
 
@@ -88,14 +95,16 @@ Defaults to 4.
             str: String with hiding part.
         """
 
+        mask = cls.HIDING_MASK
+
         # If show_len is 0 or the length of the string is smaller than the hiding mask length
         # and show_len from both sides of the string, return only hiding mask.
-        if show_len == 0 or len(string) <= (len(cls.HIDING_MASK) + show_len*2):
-            return cls.HIDING_MASK
+        if show_len == 0 or len(string) <= (len(mask) + show_len*2):
+            return mask
 
         # Return the string with the hiding mask, surrounded by the specified number of characters
         # to display on each side of the string.
-        return f"{string[:show_len]}{cls.HIDING_MASK}{string[-show_len:]}"
+        return f"{string[:show_len]}{mask}{string[-show_len:]}"
 
     @classmethod
     def hide_private(cls, input_data: dict, fields: dict = None) -> dict:
@@ -103,7 +112,8 @@ Defaults to 4.
 
         Args:
             input_data (dict): Input dictionary with private fields.
-            fields (dict): Dictionary of private fields and their filtering regexps.
+            fields (dict): Dictionary of private fields and their filtering regexps \
+(strings or compiled patterns).
 
         Returns:
             dict: Result dictionary without private data.
@@ -119,7 +129,10 @@ only 'dict' is expected")
             return cls.mask_secret(match.group(0))
 
         def hide_str(k, v):
-            return re.sub(private_fields[k], gen_repl, v)
+            pattern = private_fields[k]
+            if not isinstance(pattern, re.Pattern):
+                pattern = re.compile(pattern)
+            return pattern.sub(gen_repl, v)
 
         def hide_dict(v):
             return cls.hide_private(v, private_fields)
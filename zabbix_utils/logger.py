@@ -30,6 +30,20 @@ from .common import ModuleUtils
 class EmptyHandler(logging.Handler):
     """Empty logging handler."""
 
+    # The handler discards every record, so there is nothing to protect
+    # with a lock and no reason to run filters before dropping a record.
+    def createLock(self):
+        self.lock = None
+
+    def acquire(self):
+        pass
+
+    def release(self):
+        pass
+
+    def handle(self, record):
+        return record
+
     def emit(self, *args, **kwargs):
         pass
 
@@ -37,17 +51,32 @@ class EmptyHandler(logging.Handler):
 class SensitiveFilter(logging.Filter):
     """Filter to hide sensitive Zabbix info (password, auth) in logs"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    # json.dumps() creates a new encoder for every call with non-default options,
+    # so the encoder for the log output is created once and reused.
+    json_encoder = json.JSONEncoder(indent=4, separators=(',', ': '))
 
     def __hide_data(self, raw_data):
-        return json.dumps(ModuleUtils.hide_private(raw_data), indent=4, separators=(',', ': '))
+        return self.json_encoder.encode(ModuleUtils.hide_private(raw_data))
 
     def filter(self, record):
+        # Nothing to hide for records logged without arguments
+        if not record.args:
+            return 1
+
+        hide_data = self.__hide_data
+
         if isinstance(record.args, tuple):
-            record.args = tuple(self.__hide_data(arg)
-                                if isinstance(arg, dict) else arg for arg in record.args)
+            # Only dict arguments can contain private fields, so the
+            # arguments are copied only when the first of them is found.
+            new_args = None
+            for i, arg in enumerate(record.args):
+                if isinstance(arg, dict):
+                    if new_args is None:
+                        new_args = list(record.args)
+                    new_args[i] = hide_data(arg)
+            if new_args is not None:
+                record.args = tuple(new_args)
         if isinstance(record.args, dict):
-            record.args = self.__hide_data(record.args)
+            record.args = hide_data(record.args)
 
         return 1